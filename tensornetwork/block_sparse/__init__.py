@@ -2,6 +2,9 @@ from tensornetwork.block_sparse import index
 from tensornetwork.block_sparse import charge
 from tensornetwork.block_sparse import blocksparsetensor
 from tensornetwork.block_sparse import linalg
+from tensornetwork.block_sparse import caching
+#pylint: disable=line-too-long
+from tensornetwork.block_sparse.caching import enable_caching, disable_caching, clear_cache, get_cacher
 #pylint: disable=line-too-long
 from tensornetwork.block_sparse.blocksparsetensor import BlockSparseTensor, ChargeArray, tensordot, outerproduct
 #pylint: disable=line-too-long
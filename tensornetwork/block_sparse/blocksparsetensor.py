@@ -173,6 +173,9 @@ class ChargeArray:
   def sparse_shape(self) -> Tuple:
     """
     The sparse shape of the tensor.
+    The returned `Index` objects are lightweight views: they share the
+    tensor's `BaseCharge` objects instead of copying the charge data.
+    Use `Index.copy()` before mutating an index (e.g. to flip a flow).
     Returns:
       Tuple: A tuple of `Index` objects.
     """
@@ -209,9 +212,10 @@ class ChargeArray:
     ```
     the same code for ChargeArray
     ```
-    q1 = U1Charge(np.random.randint(0,10,6))
-    q2 = U1Charge(np.random.randint(0,10,6))
-    q3 = U1Charge(np.random.randint(0,10,6))
+    #draw the charges of all legs with a single RNG call
+    q1, q2, q3 = [
+        U1Charge(q) for q in np.split(np.random.randint(0, 10, 18), 3)
+    ]
     i1 = Index(charges=q1,flow=False)
     i2 = Index(charges=q2,flow=True)
     i3 = Index(charges=q3,flow=False)
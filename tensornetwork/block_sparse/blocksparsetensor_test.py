@@ -77,6 +77,17 @@ def test_ChargeArray_generic(dtype, chargetype):
     assert arr.sparse_shape[n] == indices[n]
 
 
+@pytest.mark.parametrize('chargetype', ["U1", "Z2", "mixed"])
+def test_ChargeArray_sparse_shape_shares_charges(chargetype):
+  Ds = [8, 9, 10, 11]
+  indices = [Index(get_charge(chargetype, 1, Ds[n]), False) for n in range(4)]
+  arr = ChargeArray.random(indices)
+  sparse_shape = arr.sparse_shape
+  #the returned Index objects are views sharing the tensor's charges
+  for n in range(4):
+    assert sparse_shape[n].flat_charges[0] is arr._charges[n]
+
+
 @pytest.mark.parametrize('dtype', np_dtypes)
 @pytest.mark.parametrize('num_charges', [1, 2, 3])
 @pytest.mark.parametrize('chargetype', ["U1", "Z2", "mixed"])
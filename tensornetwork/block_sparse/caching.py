@@ -0,0 +1,89 @@
+# Copyright 2019 The TensorNetwork Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+
+class Cacher:
+  """
+  A simple cache for block-data of `BlockSparseTensor`.
+  Finding the diagonal sparse blocks of a symmetric tensor
+  requires sorting and merging of charge arrays. This meta-data
+  computation depends only on the charges, flows and the desired
+  bi-partition of the tensor legs, and is thus identical across
+  repeated operations on tensors with the same meta-data (as they
+  appear e.g. in iterative algorithms like DMRG). `Cacher` memoizes
+  these block decompositions so they are computed only once.
+  """
+
+  def __init__(self) -> None:
+    self.cache = {}
+    self.do_caching = False
+
+  def set_status(self, value: bool) -> None:
+    self.do_caching = value
+
+  def clear_cache(self) -> None:
+    self.cache = {}
+
+  @property
+  def is_empty(self) -> bool:
+    return len(self.cache) == 0
+
+
+# singleton, initialized upon first call to `get_cacher`
+_INSTANTIATED_CACHERS = []
+
+
+def get_cacher() -> Cacher:
+  """
+  Return a `Cacher` object which can be used to perform
+  caching of block-data for block-sparse tensor contractions.
+  """
+  if len(_INSTANTIATED_CACHERS) == 0:
+    _INSTANTIATED_CACHERS.append(Cacher())
+  return _INSTANTIATED_CACHERS[0]
+
+
+def enable_caching() -> None:
+  """
+  Enable caching of block-data for block-sparse contractions.
+  If enabled, the block-data of the diagonal sparse blocks of
+  a `BlockSparseTensor` is cached and reused whenever a tensor
+  with identical meta-data (charges, flows and partition) is
+  encountered again. Note that the cache can use a substantial
+  amount of memory for tensors with many different meta-data
+  combinations. Use `tn.block_sparse.clear_cache()` to free it.
+  """
+  get_cacher().set_status(True)
+
+
+def disable_caching() -> None:
+  """
+  Disable caching of block-data for block-sparse tensor contractions.
+  Note that the cache WILL NOT BE CLEARED.
+  Clearing the cache can be achieved by calling
+  `tn.block_sparse.clear_cache()`.
+  """
+  get_cacher().set_status(False)
+
+
+def clear_cache() -> None:
+  """
+  Clear the cache that stores block-data for block-sparse tensor
+  contractions.
+  """
+  get_cacher().clear_cache()
@@ -0,0 +1,91 @@
+import numpy as np
+# pylint: disable=line-too-long
+from tensornetwork.block_sparse.caching import get_cacher, enable_caching, disable_caching, clear_cache
+from tensornetwork.block_sparse.charge import U1Charge
+from tensornetwork.block_sparse.index import Index
+# pylint: disable=line-too-long
+from tensornetwork.block_sparse.blocksparsetensor import BlockSparseTensor, tensordot
+from tensornetwork.block_sparse.utils import _find_diagonal_sparse_blocks
+
+
+def test_get_cacher():
+  cacher = get_cacher()
+  assert get_cacher() is cacher
+
+
+def test_enable_disable_caching():
+  enable_caching()
+  assert get_cacher().do_caching
+  disable_caching()
+  assert not get_cacher().do_caching
+
+
+def test_clear_cache():
+  enable_caching()
+  D = 10
+  i0 = Index(U1Charge.random(D, -2, 2), False)
+  i1 = Index(U1Charge.random(D, -2, 2), False)
+  i2 = Index(U1Charge.random(D, -2, 2), False)
+  A = BlockSparseTensor.random([i0, i1, i2])
+  tensordot(A, A.conj(), ([0, 1], [0, 1]))
+  assert not get_cacher().is_empty
+  disable_caching()
+  clear_cache()
+  assert get_cacher().is_empty
+
+
+def test_cache_hit():
+  enable_caching()
+  D = 10
+  i0 = Index(U1Charge.random(D, -2, 2), False)
+  i1 = Index(U1Charge.random(D, -2, 2), True)
+  charges, flows = [i0.flat_charges[0], i1.flat_charges[0]], [False, True]
+  blocks1 = _find_diagonal_sparse_blocks(charges, flows, 1)
+  blocks2 = _find_diagonal_sparse_blocks(charges, flows, 1)
+  #the cached result is returned on the second call
+  assert blocks1 is blocks2
+  disable_caching()
+  clear_cache()
+
+
+def test_no_cache_collision_between_dtypes():
+  enable_caching()
+  #identical raw bytes, but different charges due to the different dtypes
+  c1 = U1Charge(np.array([256, 512], dtype=np.int16))
+  c2 = U1Charge(np.array([0, 1, 0, 2], dtype=np.int8), charge_dtype=np.int8)
+  blocks1 = _find_diagonal_sparse_blocks([c1, c1], [False, True], 1)
+  blocks2 = _find_diagonal_sparse_blocks([c2, c2], [False, True], 1)
+  disable_caching()
+  clear_cache()
+  expected1 = _find_diagonal_sparse_blocks([c1, c1], [False, True], 1)
+  expected2 = _find_diagonal_sparse_blocks([c2, c2], [False, True], 1)
+  np.testing.assert_allclose(blocks1[2], expected1[2])
+  np.testing.assert_allclose(blocks2[2], expected2[2])
+
+
+def test_cached_results_agree():
+  D = 20
+  i0 = Index(U1Charge.random(D, -3, 3), False)
+  i1 = Index(U1Charge.random(D, -3, 3), False)
+  i2 = Index(U1Charge.random(D, -3, 3), False)
+  A = BlockSparseTensor.random([i0, i1, i2])
+  expected = tensordot(A, A.conj(), ([0, 1], [0, 1]))
+  enable_caching()
+  actual = tensordot(A, A.conj(), ([0, 1], [0, 1]))
+  #run a second time to hit the cache
+  actual2 = tensordot(A, A.conj(), ([0, 1], [0, 1]))
+  disable_caching()
+  clear_cache()
+  np.testing.assert_allclose(expected.todense(), actual.todense())
+  np.testing.assert_allclose(expected.todense(), actual2.todense())
+
+
+def test_caching_disabled_by_default():
+  assert not get_cacher().do_caching
+  D = 10
+  i0 = Index(U1Charge.random(D, -2, 2), False)
+  i1 = Index(U1Charge.random(D, -2, 2), False)
+  i2 = Index(U1Charge.random(D, -2, 2), False)
+  A = BlockSparseTensor.random([i0, i1, i2])
+  tensordot(A, A.conj(), ([0, 1], [0, 1]))
+  assert get_cacher().is_empty
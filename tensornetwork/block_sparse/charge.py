@@ -107,7 +107,11 @@ class BaseCharge:
         "`identity_charge` has to be implemented in derived classes")
 
   @classmethod
-  def random(cls, dimension: int, minval: int, maxval: int):
+  def random(cls,
+             dimension: int,
+             minval: int,
+             maxval: int,
+             charge_dtype: Optional[Type[np.number]] = np.int16):
     raise NotImplementedError(
         "`random` has to be implemented in derived classes")
 
@@ -534,7 +538,10 @@ class U1Charge(BaseCharge):
 
   @staticmethod
   def fuse(charge1, charge2) -> np.ndarray:
-    return np.add.outer(charge1, charge2).ravel()
+    #accumulate in at least 16 bit to avoid overflow for narrow
+    #charge dtypes (e.g. np.int8)
+    dtype = np.result_type(charge1.dtype, charge2.dtype, np.int16)
+    return np.add.outer(charge1, charge2, dtype=dtype).ravel()
 
   @staticmethod
   def dual_charges(charges) -> np.ndarray:
@@ -545,9 +552,14 @@ class U1Charge(BaseCharge):
     return np.int16(0)
 
   @classmethod
-  def random(cls, dimension: int, minval: int, maxval: int) -> BaseCharge:
-    charges = np.random.randint(minval, maxval + 1, dimension, dtype=np.int16)
-    return cls(charges=charges)
+  def random(cls,
+             dimension: int,
+             minval: int,
+             maxval: int,
+             charge_dtype: Optional[Type[np.number]] = np.int16) -> BaseCharge:
+    charges = np.random.randint(
+        minval, maxval + 1, dimension, dtype=charge_dtype)
+    return cls(charges=charges, charge_dtype=charge_dtype)
 
 
 class Z2Charge(BaseCharge):
@@ -585,12 +597,13 @@ class Z2Charge(BaseCharge):
   def random(cls,
              dimension: int,
              minval: int = 0,
-             maxval: int = 1) -> BaseCharge:
+             maxval: int = 1,
+             charge_dtype: Optional[Type[np.number]] = np.int16) -> BaseCharge:
     if minval != 0 or maxval != 1:
       raise ValueError("Z2 charges can only take values 0 or 1")
 
-    charges = np.random.randint(0, 2, dimension, dtype=np.int16)
-    return cls(charges=charges)
+    charges = np.random.randint(0, 2, dimension, dtype=charge_dtype)
+    return cls(charges=charges, charge_dtype=charge_dtype)
 
 
 def ZNCharge(n: int) -> Callable:
@@ -622,8 +635,11 @@ def ZNCharge(n: int) -> Callable:
 
     @staticmethod
     def fuse(charge1, charge2) -> np.ndarray:
+      #accumulate in at least 16 bit to avoid overflow for narrow
+      #charge dtypes (e.g. np.int8)
+      dtype = np.result_type(charge1.dtype, charge2.dtype, np.int16)
       #pylint: disable=no-member
-      return np.outer(charge1, charge2).ravel() % n
+      return np.multiply.outer(charge1, charge2, dtype=dtype).ravel() % n
 
     @staticmethod
     def dual_charges(charges) -> np.ndarray:
@@ -637,14 +653,17 @@ def ZNCharge(n: int) -> Callable:
     def random(cls,
                dimension: int,
                minval: int = 0,
-               maxval: int = n) -> BaseCharge:
+               maxval: int = n,
+               charge_dtype: Optional[Type[np.number]] = np.int16
+              ) -> BaseCharge:
       if maxval >= n:
         raise ValueError(f"maxval must be less than n={n}, got {maxval}")
       if minval < 0:
         raise ValueError(f"minval must be greater than 0, found {minval}")
       # No need for the mod due to the checks above.
-      charges = np.random.randint(minval, maxval + 1, dimension, dtype=np.int16)
-      return cls(charges=charges)
+      charges = np.random.randint(
+          minval, maxval + 1, dimension, dtype=charge_dtype)
+      return cls(charges=charges, charge_dtype=charge_dtype)
 
   return ModularCharge
 
@@ -661,13 +680,15 @@ def fuse_ndarray_charges(charges_A: np.ndarray, charges_B: np.ndarray,
   Returns:
     np.ndarray: n-by-(D1 * D2) dimensional array of the fused charges.
   """
-  comb_charges = [0] * len(charge_types)
+  #preallocate the output and fill its rows in place; this avoids the
+  #temporary produced by concatenating the per-symmetry results
+  dtype = np.result_type(charges_A.dtype, charges_B.dtype, np.int16)
+  fused = np.empty(
+      (len(charge_types), charges_A.shape[1] * charges_B.shape[1]),
+      dtype=dtype)
   for n, ct in enumerate(charge_types):
-    comb_charges[n] = ct.fuse(charges_A[n, :], charges_B[n, :])
-
-  return np.concatenate(
-      comb_charges, axis=0).reshape(
-          len(charge_types), charges_A.shape[1] * charges_B.shape[1])
+    fused[n, :] = ct.fuse(charges_A[n, :], charges_B[n, :])
+  return fused
 
 
 def intersect(A: np.ndarray,
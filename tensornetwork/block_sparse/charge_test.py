@@ -1,3 +1,4 @@
+from typing import Optional, Type
 import numpy as np
 import pytest
 # pylint: disable=line-too-long
@@ -485,8 +486,13 @@ def test_isin_raises():
       return np.int16(0)
 
     @classmethod
-    def random(cls, dimension: int, minval: int, maxval: int) -> np.ndarray:
-      charges = np.random.randint(minval, maxval, dimension, dtype=np.int16)
+    def random(cls,
+               dimension: int,
+               minval: int,
+               maxval: int,
+               charge_dtype: Optional[Type[np.number]] = np.int16
+              ) -> np.ndarray:
+      charges = np.random.randint(minval, maxval, dimension, dtype=charge_dtype)
       return cls(charges=charges)
 
   np.random.seed(10)
@@ -589,3 +595,34 @@ def test_zncharge_raises():
     ZNCharge(0)
   with pytest.raises(ValueError, match="Z7 charges must be in"):
     ZNCharge(7)([0, 4, 9])
+
+
+@pytest.mark.parametrize('chargetype, B0, B1', [(U1Charge, -5, 5),
+                                                (Z2Charge, 0, 1),
+                                                (ZNCharge(3), 0, 2)])
+def test_Charge_random_dtype(chargetype, B0, B1):
+  D = 100
+  np.random.seed(10)
+  q = chargetype.random(D, B0, B1, charge_dtype=np.int8)
+  assert q.dtype == np.int8
+  assert np.all(q.charges >= B0)
+  assert np.all(q.charges <= B1)
+
+
+def test_U1Charge_fuse_narrow_dtype():
+  #fusion of charges stored in narrow dtypes must not overflow
+  c1 = np.array([100, -100], dtype=np.int8)
+  c2 = np.array([100, -100], dtype=np.int8)
+  fused = U1Charge.fuse(c1, c2)
+  np.testing.assert_allclose(fused, [200, 0, 0, -200])
+
+
+def test_U1Charge_fusion_int8():
+  D = 100
+  np.random.seed(10)
+  q1 = U1Charge.random(D, -5, 5, charge_dtype=np.int8)
+  q2 = U1Charge.random(D, -5, 5, charge_dtype=np.int8)
+  expected = U1Charge(q1.charges.astype(np.int16)) + U1Charge(
+      q2.charges.astype(np.int16))
+  fused = q1 + q2
+  assert np.all(fused.charges == expected.charges)
@@ -19,6 +19,7 @@ import numpy as np
 from tensornetwork.block_sparse.index import Index
 # pylint: disable=line-too-long
 from tensornetwork.block_sparse.charge import fuse_charges, fuse_degeneracies, BaseCharge, fuse_ndarray_charges, intersect, charge_equal, fuse_ndarrays
+from tensornetwork.block_sparse.caching import get_cacher
 # pylint: disable=line-too-long
 from typing import List, Union, Any, Tuple, Optional
 Tensor = Any
@@ -362,28 +363,74 @@ def reduce_charges(charges: List[BaseCharge],
   return obj
 
 
+def _to_string(charges: List[BaseCharge], flows: Union[np.ndarray, List[bool]],
+               tr_partition: int, order: Union[List[int], np.ndarray]) -> str:
+  """
+  Map the meta-data of a block decomposition (as passed to
+  `_find_diagonal_sparse_blocks` or
+  `_find_transposed_diagonal_sparse_blocks`) to a string,
+  usable as a dictionary key for caching.
+  Args:
+    charges: List of `BaseCharge`, one for each leg of a tensor.
+    flows: A list of bool, one for each leg of a tensor.
+    tr_partition: The location of the bi-partition.
+    order: The (possibly permuted) order of the tensor legs.
+  Returns:
+    str: The string representation of the meta-data.
+  """
+  #dtype and shape are included because identical raw bytes can encode
+  #different charges for different dtypes (e.g. int8 vs int16 storage)
+  return ''.join([str(c.charge_types) for c in charges] +
+                 [str(c.charges.dtype) for c in charges] +
+                 [str(c.charges.shape) for c in charges] +
+                 [str(c.charges.tobytes()) for c in charges] +
+                 [str(np.asarray(flows).tobytes()),
+                  str(tr_partition),
+                  str(np.asarray(order).tobytes())])
+
+
 def _find_diagonal_sparse_blocks(
     charges: List[BaseCharge], flows: Union[np.ndarray, List[bool]],
     partition: int) -> Tuple[List, BaseCharge, np.ndarray]:
   """
   Find the location of all non-trivial symmetry blocks from the data vector of
-  of BlockSparseTensor (when viewed as a matrix across some prescribed index 
+  of BlockSparseTensor (when viewed as a matrix across some prescribed index
   bi-partition).
+  The actual computation is only performed if no cached result
+  for the given meta-data is found (see
+  `tn.block_sparse.enable_caching`).
   Args:
-    charges: List of `BaseCharge`, one for each leg of a tensor. 
+    charges: List of `BaseCharge`, one for each leg of a tensor.
     flows: A list of bool, one for each leg of a tensor.
-      with values `False` or `True` denoting inflowing and 
+      with values `False` or `True` denoting inflowing and
       outflowing charge direction, respectively.
-    partition: location of tensor partition (i.e. such that the 
-      tensor is viewed as a matrix between `charges[:partition]` and 
+    partition: location of tensor partition (i.e. such that the
+      tensor is viewed as a matrix between `charges[:partition]` and
       the remaining charges).
   Returns:
-    block_maps (List[np.ndarray]): list of integer arrays, which each 
+    block_maps (List[np.ndarray]): list of integer arrays, which each
       containing the location of a symmetry block in the data vector.
     block_qnums (BaseCharge): The charges of the corresponding blocks.n
       block, with 'n' the number of symmetries and 'm' the number of blocks.
     block_dims (np.ndarray): 2-by-m array of matrix dimensions of each block.
   """
+  cacher = get_cacher()
+  if not cacher.do_caching:
+    return _compute_diagonal_sparse_blocks(charges, flows, partition)
+
+  hash_val = _to_string(charges, flows, partition, np.arange(len(charges)))
+  if hash_val not in cacher.cache:
+    cacher.cache[hash_val] = _compute_diagonal_sparse_blocks(
+        charges, flows, partition)
+  return cacher.cache[hash_val]
+
+
+def _compute_diagonal_sparse_blocks(
+    charges: List[BaseCharge], flows: Union[np.ndarray, List[bool]],
+    partition: int) -> Tuple[List, BaseCharge, np.ndarray]:
+  """
+  Implementation of `_find_diagonal_sparse_blocks`, without caching.
+  """
   num_inds = len(charges)
   num_syms = charges[0].num_symmetries
 
@@ -475,12 +522,12 @@ def _find_transposed_diagonal_sparse_blocks(
     flows: A list of bool, one for each leg of a tensor.
       with values `False` or `True` denoting inflowing and 
       outflowing charge direction, respectively.
-    tr_partition: Location of the transposed tensor partition (i.e. such that the 
-      tensor is viewed as a matrix between `charges[order[:partition]]` and 
+    tr_partition: Location of the transposed tensor partition (i.e. such that the
+      tensor is viewed as a matrix between `charges[order[:partition]]` and
       `charges[order[partition:]]`).
-    order: Order with which to permute the tensor axes. 
+    order: Order with which to permute the tensor axes.
   Returns:
-    block_maps (List[np.ndarray]): list of integer arrays, which each 
+    block_maps (List[np.ndarray]): list of integer arrays, which each
       containing the location of a symmetry block in the data vector.
     block_qnums (BaseCharge): The charges of the corresponding blocks.
     block_dims (np.ndarray): 2-by-m array of matrix dimensions of each block.
@@ -491,6 +538,28 @@ def _find_transposed_diagonal_sparse_blocks(
     # no transpose order
     return _find_diagonal_sparse_blocks(charges, flows, tr_partition)
 
+  cacher = get_cacher()
+  if not cacher.do_caching:
+    return _compute_transposed_diagonal_sparse_blocks(charges, flows,
+                                                      tr_partition, order)
+
+  hash_val = _to_string(charges, flows, tr_partition, order)
+  if hash_val not in cacher.cache:
+    cacher.cache[hash_val] = _compute_transposed_diagonal_sparse_blocks(
+        charges, flows, tr_partition, order)
+  return cacher.cache[hash_val]
+
+
+def _compute_transposed_diagonal_sparse_blocks(
+    charges: List[BaseCharge],
+    flows: Union[np.ndarray, List[bool]],
+    tr_partition: int,
+    order: Union[List, np.ndarray],
+) -> Tuple[List, BaseCharge, np.ndarray]:
+  """
+  Implementation of `_find_transposed_diagonal_sparse_blocks` for a
+  non-trivial transposition, without caching.
+  """
   # general case: non-trivial transposition is required
   num_inds = len(charges)
   tensor_dims = np.array([charges[n].dim for n in range(num_inds)], dtype=int)